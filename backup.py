@@ -63,9 +63,19 @@ def backup_database() -> Path:
     timestamp = datetime.now().strftime(_TIMESTAMP_FMT)
     backup_path = BACKUP_DIR / f'{_BACKUP_PREFIX}{timestamp}.db'
 
-    src = sqlite3.connect(str(db_path))
+    _copy_database(db_path, backup_path)
+
+    size_kb = backup_path.stat().st_size / 1024
+    logger.info('Backup created: %s (%.1f KB)', backup_path.name, size_kb)
+    _prune_old_backups()
+    return backup_path
+
+
+def _copy_database(src_path: Path, dst_path: Path) -> None:
+    """Copy src_path to dst_path page by page using sqlite3's online backup API."""
+    src = sqlite3.connect(str(src_path))
     try:
-        dst = sqlite3.connect(str(backup_path))
+        dst = sqlite3.connect(str(dst_path))
         try:
             src.backup(dst)
         finally:
@@ -73,11 +83,6 @@ def backup_database() -> Path:
     finally:
         src.close()
 
-    size_kb = backup_path.stat().st_size / 1024
-    logger.info('Backup created: %s (%.1f KB)', backup_path.name, size_kb)
-    _prune_old_backups()
-    return backup_path
-
 
 def list_backups() -> list[Path]:
     """Return all backup files sorted oldest-first."""
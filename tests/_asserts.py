@@ -0,0 +1,49 @@
+"""
+Assertion helpers shared by the test suites.
+
+Registered for pytest's assertion rewriting in tests/conftest.py, so failing
+asserts in here report the compared values just like asserts in test modules.
+"""
+import re
+from contextlib import contextmanager
+from functools import lru_cache
+from urllib.parse import urlparse
+
+from sqlalchemy import event
+
+
+def assert_redirects(response, path):
+    """Assert that response is a 302 redirect to path, ignoring any query string."""
+    assert response.status_code == 302
+    assert urlparse(response.location).path == path
+
+
+@lru_cache(maxsize=None)
+def _needle_pattern(needles):
+    return re.compile(b'|'.join(map(re.escape, needles)))
+
+
+def contains_any(data, *needles):
+    """Return True if any of the byte strings occurs in data, in a single scan."""
+    return _needle_pattern(needles).search(data) is not None
+
+
+@contextmanager
+def count_queries(engine):
+    """Collect the SQL statements executed on engine inside the block.
+
+    Yields a list that fills up as statements run, so a test can put an upper
+    bound on the queries a code path issues. SAVEPOINT bookkeeping from the
+    per-test transaction is left out.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith(('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT')):
+            statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
@@ -0,0 +1 @@
+# Integration tests: routes, forms and models against the Flask app
@@ -0,0 +1,363 @@
+"""
+Fixtures for integration tests: the Flask app, its database and logged-in clients.
+"""
+import os
+
+# Set test database BEFORE importing app - this is critical!
+# Named shared-cache in-memory database: nothing touches disk, and the database
+# lives for as long as the pooled connection below stays open. The name carries
+# the xdist worker id so each worker process has a database of its own.
+_worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+os.environ['DATABASE_URL'] = f'sqlite:///file:memdb_{_worker_id}?mode=memory&cache=shared&uri=true'
+
+import pytest
+from datetime import date, timedelta
+from flask_login import login_user
+from freezegun import freeze_time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from werkzeug.security import generate_password_hash
+
+from config import Config
+
+# The date every test runs on; see the today fixture.
+TODAY = date.today()
+
+# Reuse a single connection for every request context in the test session.
+# Must be set before app is imported, since the engine is built at import time.
+Config.SQLALCHEMY_ENGINE_OPTIONS = {
+    'poolclass': StaticPool,
+    'connect_args': {'check_same_thread': False},
+}
+
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Trade durability for speed - the test database is throwaway."""
+    # Stop pysqlite from issuing its own BEGIN/COMMIT so SAVEPOINTs nest
+    # correctly; _begin_transaction below emits BEGIN instead.
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA synchronous=OFF')
+    cursor.execute('PRAGMA journal_mode=MEMORY')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA locking_mode=EXCLUSIVE')
+    # SQLite ignores FOREIGN KEY constraints unless asked; enforce them so a
+    # test can't silently insert rows that point at missing parents.
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+
+
+@event.listens_for(Engine, 'begin')
+def _begin_transaction(connection):
+    connection.exec_driver_sql('BEGIN')
+
+
+from app import app, db
+from models import User, Account, Transaction, Category, Budget, BudgetItem, BudgetAccountGoal, FixedDeposit
+
+
+@pytest.fixture(scope='session')
+def test_app():
+    """Create application for testing, building the schema once per session.
+
+    Each xdist worker process runs this conftest and gets its own in-memory
+    database, so no cross-worker locking is needed around schema creation.
+    """
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        Category.init_default_categories()
+    return app
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _fast_password_hashing():
+    """Hash test passwords with a single pbkdf2 iteration.
+
+    The production hash runs hundreds of thousands of iterations (~0.2s) and is
+    computed for every user a test creates or logs in as. The stored format is
+    unchanged, so models.check_password_hash verifies these hashes as usual.
+    """
+    def fast_generate_password_hash(password, method='pbkdf2:sha256', salt_length=16):
+        return generate_password_hash(password, method='pbkdf2:sha256:1', salt_length=salt_length)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('models.generate_password_hash', fast_generate_password_hash)
+        yield
+
+
+@pytest.fixture(scope='function', autouse=True)
+def db_session(request):
+    """Run each test inside a transaction that is rolled back afterwards.
+
+    db.session is rebound to a single connection holding an outer transaction.
+    Every session commit - in fixtures, tests or route handlers - only releases
+    a SAVEPOINT inside it, so rolling back the outer transaction on teardown
+    discards everything the test wrote without rebuilding the schema. The app
+    context stays pushed until teardown, so tests can use db.session and
+    Model.query without opening their own.
+
+    Requests _seed_user before opening the transaction so the shared user is
+    always committed first, even when a test only reaches test_user through
+    request.getfixturevalue().
+    """
+    if request.node.get_closest_marker('no_db'):
+        # Pure computations over unsaved model instances; skip the app, the
+        # seeded user and the connection.
+        yield None
+        return
+
+    test_app = request.getfixturevalue('test_app')
+    request.getfixturevalue('_seed_user')
+
+    with test_app.app_context():
+        connection = db.engine.connect()
+        transaction = connection.begin()
+        original_session = db.session
+        db.session = scoped_session(
+            sessionmaker(bind=connection, join_transaction_mode='create_savepoint'),
+            scopefunc=original_session.registry.scopefunc
+        )
+        try:
+            yield db.session
+        finally:
+            db.session.remove()
+            db.session = original_session
+            transaction.rollback()
+            connection.close()
+
+
+@pytest.fixture(scope='function')
+def client(test_app):
+    """Create test client."""
+    return test_app.test_client()
+
+
+@pytest.fixture(scope='session')
+def _seed_user(test_app, _fast_password_hashing):
+    """Insert the shared test user once per session.
+
+    Runs before any per-test transaction is opened, so the row is committed for
+    real. Changes a test makes to it are rolled back with the test.
+    """
+    with test_app.app_context():
+        user = User(email='test@example.com')
+        user.set_password('password123')
+        db.session.add(user)
+        db.session.commit()
+        return user.id
+
+
+@pytest.fixture(scope='session')
+def test_user(_seed_user):
+    """Return the id of the shared test user."""
+    return _seed_user
+
+
+@pytest.fixture(scope='session')
+def login_as(test_app):
+    """Return a callable that logs a test client in as the given user id.
+
+    Writes a signed session cookie carrying the Flask-Login keys instead of
+    POSTing to /login, skipping form validation and the password hash check.
+    Tests of the login flow itself use the plain client fixture.
+    """
+    # client.session_transaction() is unusable with the pinned Flask 2.3.0 /
+    # Werkzeug 2.3.7 pair, so sign the session the same way Flask would.
+    serializer = test_app.session_interface.get_signing_serializer(test_app)
+
+    def login(client, user_id):
+        client.set_cookie(
+            test_app.config['SESSION_COOKIE_NAME'],
+            serializer.dumps({'_user_id': str(user_id), '_fresh': True})
+        )
+        return client
+
+    return login
+
+
+@pytest.fixture(scope='function')
+def logged_in_client(client, test_user, login_as):
+    """Create a test client logged in as the shared test user."""
+    return login_as(client, test_user)
+
+
+@pytest.fixture(scope='function')
+def other_user(db_session):
+    """Create a second user who owns none of the test data, and return its id."""
+    user = User(email='other@example.com')
+    user.set_password('password123')
+    db_session.add(user)
+    db_session.flush()
+    return user.id
+
+
+@pytest.fixture(scope='function')
+def other_user_client(client, other_user, login_as):
+    """Create a test client logged in as the second user."""
+    return login_as(client, other_user)
+
+
+@pytest.fixture(scope='function')
+def call_view(test_app, test_user):
+    """Return a callable that runs a view function in-process as the test user.
+
+    Pushes a request context carrying the form data and calls the endpoint's view
+    directly, skipping the test client's request encoding and WSGI dispatch. Use
+    it for CRUD tests that only check database state; keep at least one test per
+    route going through the client to cover routing and the session cookie.
+    """
+    urls = test_app.url_map.bind('localhost')
+
+    def call(endpoint, form=None, **view_args):
+        path = urls.build(endpoint, view_args)
+        with test_app.test_request_context(path, method='POST', data=form):
+            login_user(db.session.get(User, test_user))
+            return test_app.view_functions[endpoint](**view_args)
+
+    return call
+
+
+@pytest.fixture(scope='session')
+def flashes(test_app):
+    """Return a callable reading the (category, message) flashes a client holds.
+
+    Decodes the session cookie directly, so a test can check a redirect's flash
+    message without following the redirect and rendering the target page.
+    """
+    serializer = test_app.session_interface.get_signing_serializer(test_app)
+
+    def read(client):
+        cookie = client.get_cookie(test_app.config['SESSION_COOKIE_NAME'])
+        if cookie is None:
+            return []
+        return [tuple(flash) for flash in serializer.loads(cookie.value).get('_flashes', [])]
+
+    return read
+
+
+@pytest.fixture(scope='function', autouse=True)
+def today():
+    """Freeze date.today() at TODAY for every test and return it.
+
+    The routes and models read the clock during the request, so a run that
+    crosses midnight would otherwise compare dates from different days.
+    Autouse so the clock is frozen before login_as signs the session cookie;
+    a cookie signed later than the frozen time fails its timestamp check.
+    """
+    with freeze_time(TODAY):
+        yield TODAY
+
+
+@pytest.fixture(scope='function')
+def test_account(db_session, test_user):
+    """Create a test account."""
+    account = Account(
+        user_id=test_user,
+        name='Test Checking',
+        account_type='checking',
+        currency='USD',
+        initial_balance=1000.0
+    )
+    db_session.add(account)
+    db_session.flush()
+    return account.id
+
+
+@pytest.fixture(scope='function')
+def test_savings_account(db_session, test_user):
+    """Create a test savings account."""
+    account = Account(
+        user_id=test_user,
+        name='Test Savings',
+        account_type='savings',
+        currency='USD',
+        initial_balance=5000.0
+    )
+    db_session.add(account)
+    db_session.flush()
+    return account.id
+
+
+@pytest.fixture(scope='function')
+def test_investment_account(db_session, test_user):
+    """Create a test investment account."""
+    account = Account(
+        user_id=test_user,
+        name='Test 401k',
+        account_type='investment',
+        currency='USD',
+        initial_balance=10000.0
+    )
+    db_session.add(account)
+    db_session.flush()
+    return account.id
+
+
+@pytest.fixture(scope='function')
+def test_transaction(db_session, test_account, today):
+    """Create a test transaction."""
+    transaction = Transaction(
+        account_id=test_account,
+        amount=-50.0,
+        description='Test expense',
+        category='groceries',
+        transaction_date=today
+    )
+    db_session.add(transaction)
+    db_session.flush()
+    return transaction.id
+
+
+@pytest.fixture(scope='function')
+def test_budget(db_session, test_user):
+    """Create a test budget."""
+    budget = Budget(
+        user_id=test_user,
+        name='Test Budget',
+        expected_income=5000.0,
+        expected_savings=500.0,
+        expected_investments=1000.0,
+        currency='USD',
+        is_active=True
+    )
+    db_session.add(budget)
+    db_session.flush()
+    return budget.id
+
+
+@pytest.fixture(scope='function')
+def test_inr_account(db_session, test_user):
+    """Create a test INR account."""
+    account = Account(
+        user_id=test_user,
+        name='India Savings',
+        account_type='savings',
+        currency='INR',
+        initial_balance=500000.0
+    )
+    db_session.add(account)
+    db_session.flush()
+    return account.id
+
+
+@pytest.fixture(scope='function')
+def test_fixed_deposit(db_session, test_inr_account, today):
+    """Create a one-year test fixed deposit starting today."""
+    fd = FixedDeposit(
+        account_id=test_inr_account,
+        principal=100000.0,
+        interest_rate=7.5,
+        start_date=today,
+        maturity_date=today + timedelta(days=365),
+        bank_name='SBI'
+    )
+    db_session.add(fd)
+    db_session.flush()
+    return fd.id
@@ -2,9 +2,9 @@
 Integration tests for account routes.
 """
 import pytest
-import json
 from models import Account, Transaction, db
 from datetime import date
+from tests._asserts import contains_any
 
 
 class TestAccountsListRoute:
@@ -29,74 +29,32 @@ class TestAddAccountRoute:
         """Test that add account page loads."""
         response = logged_in_client.get('/accounts/add')
         assert response.status_code == 200
-        assert b'Add Account' in response.data or b'Account Name' in response.data
-
-    def test_add_checking_account(self, logged_in_client, test_app, test_user):
-        """Test adding a checking account."""
+        assert contains_any(response.data, b'Add Account', b'Account Name')
+
+    @pytest.mark.parametrize('name,acct_type,currency,balance', [
+        ('My Checking', 'checking', 'USD', 1500.0),
+        ('My Credit Card', 'credit_card', 'USD', -500.0),
+        ('India Savings', 'savings', 'INR', 100000.0),
+        ('My 401k', 'investment', 'USD', 50000.0),
+    ])
+    def test_add_account(self, logged_in_client, test_app, test_user, name, acct_type, currency, balance):
+        """Test adding accounts of each type and currency."""
         response = logged_in_client.post('/accounts/add', data={
-            'name': 'My Checking',
-            'account_type': 'checking',
-            'currency': 'USD',
-            'initial_balance': 1500.0
+            'name': name,
+            'account_type': acct_type,
+            'currency': currency,
+            'initial_balance': balance
         }, follow_redirects=True)
 
         assert response.status_code == 200
         assert b'created successfully' in response.data
 
         with test_app.app_context():
-            account = Account.query.filter_by(name='My Checking').first()
-            assert account is not None
-            assert account.account_type == 'checking'
-            assert account.initial_balance == 1500.0
-
-    def test_add_credit_card(self, logged_in_client, test_app, test_user):
-        """Test adding a credit card account."""
-        response = logged_in_client.post('/accounts/add', data={
-            'name': 'My Credit Card',
-            'account_type': 'credit_card',
-            'currency': 'USD',
-            'initial_balance': -500.0
-        }, follow_redirects=True)
-
-        assert response.status_code == 200
-
-        with test_app.app_context():
-            account = Account.query.filter_by(name='My Credit Card').first()
-            assert account is not None
-            assert account.account_type == 'credit_card'
-            assert account.initial_balance == -500.0
-
-    def test_add_inr_account(self, logged_in_client, test_app, test_user):
-        """Test adding an INR currency account."""
-        response = logged_in_client.post('/accounts/add', data={
-            'name': 'India Savings',
-            'account_type': 'savings',
-            'currency': 'INR',
-            'initial_balance': 100000.0
-        }, follow_redirects=True)
-
-        assert response.status_code == 200
-
-        with test_app.app_context():
-            account = Account.query.filter_by(name='India Savings').first()
-            assert account is not None
-            assert account.currency == 'INR'
-
-    def test_add_investment_account(self, logged_in_client, test_app, test_user):
-        """Test adding an investment account."""
-        response = logged_in_client.post('/accounts/add', data={
-            'name': 'My 401k',
-            'account_type': 'investment',
-            'currency': 'USD',
-            'initial_balance': 50000.0
-        }, follow_redirects=True)
-
-        assert response.status_code == 200
-
-        with test_app.app_context():
-            account = Account.query.filter_by(name='My 401k').first()
+            account = Account.query.filter_by(name=name).first()
             assert account is not None
-            assert account.account_type == 'investment'
+            assert account.account_type == acct_type
+            assert account.currency == currency
+            assert account.initial_balance == balance
 
 
 class TestAccountDetailRoute:
@@ -118,22 +76,9 @@ class TestAccountDetailRoute:
         response = logged_in_client.get('/accounts/99999')
         assert response.status_code == 404
 
-    def test_account_detail_other_user(self, client, test_app, test_account):
+    def test_account_detail_other_user(self, other_user_client, test_account):
         """Test that users cannot view other users' accounts."""
-        # Create another user and log in
-        with test_app.app_context():
-            from models import User
-            user2 = User(email='other@example.com')
-            user2.set_password('password123')
-            db.session.add(user2)
-            db.session.commit()
-
-        client.post('/login', data={
-            'email': 'other@example.com',
-            'password': 'password123'
-        })
-
-        response = client.get(f'/accounts/{test_account}')
+        response = other_user_client.get(f'/accounts/{test_account}')
         assert response.status_code == 404
 
 
@@ -146,50 +91,28 @@ class TestEditAccountRoute:
         assert response.status_code == 200
         assert b'Test Checking' in response.data
 
-    def test_edit_account_name(self, logged_in_client, test_app, test_account):
-        """Test editing account name."""
-        response = logged_in_client.post(f'/accounts/{test_account}/edit', data={
-            'name': 'Updated Checking',
-            'account_type': 'checking',
-            'currency': 'USD',
-            'initial_balance': 1000.0
-        }, follow_redirects=True)
-
-        assert response.status_code == 200
-        assert b'updated successfully' in response.data
-
-        with test_app.app_context():
-            account = Account.query.get(test_account)
-            assert account.name == 'Updated Checking'
-
-    def test_edit_account_type(self, logged_in_client, test_app, test_account):
-        """Test changing account type."""
-        response = logged_in_client.post(f'/accounts/{test_account}/edit', data={
-            'name': 'Test Checking',
-            'account_type': 'savings',
-            'currency': 'USD',
-            'initial_balance': 1000.0
-        }, follow_redirects=True)
-
-        with test_app.app_context():
-            account = Account.query.get(test_account)
-            assert account.account_type == 'savings'
-
-    def test_edit_account_initial_balance(self, logged_in_client, test_app, test_account):
-        """Test editing account initial balance."""
-        response = logged_in_client.post(f'/accounts/{test_account}/edit', data={
+    @pytest.mark.parametrize('field,value', [
+        ('name', 'Updated Checking'),
+        ('account_type', 'savings'),
+        ('initial_balance', 2000.0),
+    ])
+    def test_edit_account(self, logged_in_client, test_app, test_account, field, value):
+        """Test editing account name, type and initial balance."""
+        data = {
             'name': 'Test Checking',
             'account_type': 'checking',
             'currency': 'USD',
-            'initial_balance': 2000.0
-        }, follow_redirects=True)
+            'initial_balance': 1000.0
+        }
+        data[field] = value
+        response = logged_in_client.post(f'/accounts/{test_account}/edit', data=data, follow_redirects=True)
 
         assert response.status_code == 200
         assert b'updated successfully' in response.data
 
         with test_app.app_context():
-            account = Account.query.get(test_account)
-            assert account.initial_balance == 2000.0
+            account = db.session.get(Account, test_account)
+            assert getattr(account, field) == value
 
 
 class TestDeleteAccountRoute:
@@ -203,19 +126,19 @@ class TestDeleteAccountRoute:
         assert b'deleted successfully' in response.data
 
         with test_app.app_context():
-            account = Account.query.get(test_account)
+            account = db.session.get(Account, test_account)
             assert account is None
 
     def test_delete_account_cascades_transactions(self, logged_in_client, test_app, test_account, test_transaction):
         """Test that deleting account also deletes transactions."""
         with test_app.app_context():
-            trans_before = Transaction.query.get(test_transaction)
+            trans_before = db.session.get(Transaction, test_transaction)
             assert trans_before is not None
 
         logged_in_client.post(f'/accounts/{test_account}/delete')
 
         with test_app.app_context():
-            trans_after = Transaction.query.get(test_transaction)
+            trans_after = db.session.get(Transaction, test_transaction)
             assert trans_after is None
 
 
@@ -235,24 +158,20 @@ class TestReorderAccountsRoute:
             id1, id2 = account1.id, account2.id
 
         # Reorder: put account2 first
-        response = logged_in_client.post('/accounts/reorder',
-            data=json.dumps({'order': [id2, id1]}),
-            content_type='application/json')
+        response = logged_in_client.post('/accounts/reorder', json={'order': [id2, id1]})
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
 
         with test_app.app_context():
-            acc1 = Account.query.get(id1)
-            acc2 = Account.query.get(id2)
+            acc1 = db.session.get(Account, id1)
+            acc2 = db.session.get(Account, id2)
             assert acc2.display_order < acc1.display_order
 
     def test_reorder_invalid_data(self, logged_in_client, test_app):
         """Test reorder with invalid data."""
-        response = logged_in_client.post('/accounts/reorder',
-            data=json.dumps({'invalid': 'data'}),
-            content_type='application/json')
+        response = logged_in_client.post('/accounts/reorder', json={'invalid': 'data'})
 
         assert response.status_code == 400
 
@@ -264,6 +183,7 @@ class TestUpdateBalanceRoute:
         """Test that update balance page loads for investment accounts."""
         response = logged_in_client.get(f'/accounts/{test_investment_account}/update-balance')
         assert response.status_code == 200
+        assert b'Update Investment Balance' in response.data
 
     def test_update_balance_not_allowed_for_checking(self, logged_in_client, test_app, test_account):
         """Test that balance update is not allowed for non-investment accounts."""
@@ -281,7 +201,7 @@ class TestUpdateBalanceRoute:
         assert b'updated' in response.data.lower()
 
         with test_app.app_context():
-            account = Account.query.get(test_investment_account)
+            account = db.session.get(Account, test_investment_account)
             assert account.current_balance == 15000.0
 
 
@@ -292,6 +212,7 @@ class TestCreditCardsRoute:
         """Test that credit cards page loads."""
         response = logged_in_client.get('/credit-cards')
         assert response.status_code == 200
+        assert b'Credit Cards' in response.data
 
     def test_credit_cards_shows_only_credit_cards(self, logged_in_client, test_app, test_user):
         """Test that only credit card accounts are shown."""
@@ -3,6 +3,7 @@ Integration tests for authentication routes.
 """
 import pytest
 from models import User, db
+from tests._asserts import assert_redirects, contains_any
 
 
 class TestLoginRoute:
@@ -22,7 +23,7 @@ class TestLoginRoute:
         }, follow_redirects=True)
 
         assert response.status_code == 200
-        assert b'Dashboard' in response.data or b'Logged in successfully' in response.data
+        assert contains_any(response.data, b'Dashboard', b'Logged in successfully')
 
     def test_login_wrong_password(self, client, test_user, test_app):
         """Test login with wrong password."""
@@ -54,8 +55,8 @@ class TestLoginRoute:
 
     def test_login_redirect_when_authenticated(self, logged_in_client, test_app):
         """Test that authenticated users are redirected from login page."""
-        response = logged_in_client.get('/login', follow_redirects=True)
-        assert b'Dashboard' in response.data
+        response = logged_in_client.get('/login')
+        assert_redirects(response, '/dashboard')
 
 
 class TestSignupRoute:
@@ -65,7 +66,7 @@ class TestSignupRoute:
         """Test that signup page loads successfully."""
         response = client.get('/signup')
         assert response.status_code == 200
-        assert b'Sign Up' in response.data or b'Create' in response.data
+        assert contains_any(response.data, b'Sign Up', b'Create')
 
     def test_signup_success(self, client, test_app):
         """Test successful signup."""
@@ -76,7 +77,7 @@ class TestSignupRoute:
         }, follow_redirects=True)
 
         assert response.status_code == 200
-        assert b'Account created successfully' in response.data or b'Login' in response.data
+        assert contains_any(response.data, b'Account created successfully', b'Login')
 
         # Verify user was created
         with test_app.app_context():
@@ -116,8 +117,8 @@ class TestSignupRoute:
 
     def test_signup_redirect_when_authenticated(self, logged_in_client, test_app):
         """Test that authenticated users are redirected from signup page."""
-        response = logged_in_client.get('/signup', follow_redirects=True)
-        assert b'Dashboard' in response.data
+        response = logged_in_client.get('/signup')
+        assert_redirects(response, '/dashboard')
 
 
 class TestLogoutRoute:
@@ -125,13 +126,12 @@ class TestLogoutRoute:
 
     def test_logout_success(self, logged_in_client, test_app):
         """Test successful logout."""
-        response = logged_in_client.get('/logout', follow_redirects=True)
-        assert b'logged out' in response.data.lower() or b'Login' in response.data
+        response = logged_in_client.get('/logout')
+        assert_redirects(response, '/login')
 
-    def test_logout_requires_login(self, client, test_app):
-        """Test that logout requires authentication."""
-        response = client.get('/logout', follow_redirects=True)
-        assert b'Login' in response.data
+        # The session no longer carries the user
+        response = logged_in_client.get('/dashboard')
+        assert_redirects(response, '/login')
 
 
 class TestIndexRoute:
@@ -139,63 +139,51 @@ class TestIndexRoute:
 
     def test_index_redirects_to_login(self, client, test_app):
         """Test that index redirects unauthenticated users to login."""
-        response = client.get('/', follow_redirects=True)
-        assert b'Login' in response.data
+        response = client.get('/')
+        assert_redirects(response, '/login')
 
     def test_index_redirects_to_dashboard(self, logged_in_client, test_app):
         """Test that index redirects authenticated users to dashboard."""
-        response = logged_in_client.get('/', follow_redirects=True)
-        assert b'Dashboard' in response.data
+        response = logged_in_client.get('/')
+        assert_redirects(response, '/dashboard')
 
 
 class TestProtectedRoutes:
     """Tests for route protection."""
 
-    def test_dashboard_requires_login(self, client, test_app):
-        """Test that dashboard requires authentication."""
-        response = client.get('/dashboard', follow_redirects=True)
-        assert b'Login' in response.data
-
-    def test_accounts_requires_login(self, client, test_app):
-        """Test that accounts page requires authentication."""
-        response = client.get('/accounts', follow_redirects=True)
-        assert b'Login' in response.data
-
-    def test_add_transaction_requires_login(self, client, test_app):
-        """Test that add transaction requires authentication."""
-        response = client.get('/transactions/add', follow_redirects=True)
-        assert b'Login' in response.data
-
-    def test_budget_requires_login(self, client, test_app):
-        """Test that budget page requires authentication."""
-        response = client.get('/budget', follow_redirects=True)
-        assert b'Login' in response.data
+    @pytest.mark.parametrize('url', [
+        '/dashboard',
+        '/accounts',
+        '/transactions/add',
+        '/budget',
+        '/logout',
+        '/toggle-currency',
+    ])
+    def test_route_requires_login(self, client, test_app, url):
+        """Test that protected pages require authentication."""
+        response = client.get(url)
+        assert_redirects(response, '/login')
 
 
 class TestToggleCurrency:
     """Tests for currency toggle functionality."""
 
-    def test_toggle_currency_usd_to_inr(self, logged_in_client, test_app):
+    def test_toggle_currency_usd_to_inr(self, logged_in_client, test_app, test_user):
         """Test toggling from USD to INR."""
         # First toggle (USD -> INR)
         response = logged_in_client.get('/toggle-currency', follow_redirects=True)
         assert response.status_code == 200
 
         with test_app.app_context():
-            user = User.query.filter_by(email='test@example.com').first()
+            user = db.session.get(User, test_user)
             assert user.display_currency == 'INR'
 
-    def test_toggle_currency_inr_to_usd(self, logged_in_client, test_app):
+    def test_toggle_currency_inr_to_usd(self, logged_in_client, test_app, test_user):
         """Test toggling from INR back to USD."""
         # Toggle twice
         logged_in_client.get('/toggle-currency')
         logged_in_client.get('/toggle-currency')
 
         with test_app.app_context():
-            user = User.query.filter_by(email='test@example.com').first()
+            user = db.session.get(User, test_user)
             assert user.display_currency == 'USD'
-
-    def test_toggle_currency_requires_login(self, client, test_app):
-        """Test that currency toggle requires authentication."""
-        response = client.get('/toggle-currency', follow_redirects=True)
-        assert b'Login' in response.data
@@ -0,0 +1,313 @@
+"""
+Integration tests for budget routes.
+"""
+import pytest
+from datetime import date
+from sqlalchemy import select
+from models import Budget, BudgetItem, BudgetAccountGoal, Account, Transaction, db
+from tests._asserts import assert_redirects
+
+
+class TestBudgetRoute:
+    """Tests for budget page."""
+
+    @pytest.fixture
+    def budget_setup(self, request, logged_in_client):
+        """Seed the rows named by the parametrized setup before loading /budget."""
+        setup = request.param
+        if setup == 'none':
+            return
+        request.getfixturevalue('test_budget')
+        if setup == 'budget':
+            return
+
+        from_account = request.getfixturevalue('test_account')
+        if setup == 'budget+txn':
+            db.session.add_all([
+                Transaction(account_id=from_account, amount=-150.0, description='Groceries',
+                            category='groceries', transaction_date=date.today()),
+                Transaction(account_id=from_account, amount=-50.0, description='Dinner',
+                            category='dining', transaction_date=date.today()),
+            ])
+            db.session.commit()
+            return
+
+        to_fixture, amount, description = {
+            'budget+savings_xfer': ('test_savings_account', 500.0, 'Monthly savings'),
+            'budget+invest_xfer': ('test_investment_account', 1000.0, '401k contribution'),
+        }[setup]
+        logged_in_client.post('/transfer', data={
+            'from_account_id': from_account,
+            'to_account_id': request.getfixturevalue(to_fixture),
+            'amount': amount,
+            'description': description,
+            'transfer_date': date.today().isoformat()
+        })
+
+    @pytest.mark.parametrize('budget_setup', [
+        'none',
+        'budget',
+        'budget+txn',
+        'budget+savings_xfer',
+        'budget+invest_xfer',
+    ], indirect=True)
+    def test_budget_page_loads(self, logged_in_client, budget_setup):
+        """Test that budget page loads with and without budget, spending and contributions."""
+        response = logged_in_client.get('/budget')
+        assert response.status_code == 200
+
+
+class TestEditBudgetRoute:
+    """Tests for creating/editing budget."""
+
+    def test_edit_budget_page_loads(self, logged_in_client, test_app):
+        """Test that edit budget page loads."""
+        response = logged_in_client.get('/budget/edit')
+        assert response.status_code == 200
+
+    def test_create_new_budget(self, logged_in_client, test_app, test_user):
+        """Test creating a new budget."""
+        response = logged_in_client.post('/budget/edit', data={
+            'name': 'My Monthly Budget',
+            'expected_income': 6000.0,
+            'expected_savings': 1000.0,
+            'expected_investments': 500.0,
+            'currency': 'USD'
+        }, follow_redirects=True)
+
+        assert response.status_code == 200
+        assert b'saved' in response.data.lower()
+
+        with test_app.app_context():
+            budget = db.session.execute(select(Budget).filter_by(user_id=test_user)).scalar_one()
+            assert budget.name == 'My Monthly Budget'
+            assert budget.expected_income == 6000.0
+
+    def test_edit_existing_budget(self, logged_in_client, test_app, test_budget):
+        """Test editing an existing budget."""
+        response = logged_in_client.post('/budget/edit', data={
+            'name': 'Updated Budget',
+            'expected_income': 7000.0,
+            'expected_savings': 1500.0,
+            'expected_investments': 1000.0,
+            'currency': 'USD'
+        }, follow_redirects=True)
+
+        assert response.status_code == 200
+
+        with test_app.app_context():
+            budget = db.session.get(Budget, test_budget)
+            assert budget.name == 'Updated Budget'
+            assert budget.expected_income == 7000.0
+
+
+class TestBudgetItemsRoute:
+    """Tests for budget items (category budgets)."""
+
+    @pytest.fixture(autouse=True)
+    def _ctx(self, test_app):
+        """Hold one app context open for the whole test."""
+        with test_app.app_context():
+            yield
+
+    def test_add_budget_item(self, call_view, test_budget):
+        """Test adding a budget item."""
+        response = call_view('add_budget_item', form={
+            'category': 'groceries',
+            'amount': 500.0
+        })
+
+        assert_redirects(response, '/budget')
+
+        item = db.session.execute(
+            select(BudgetItem).filter_by(budget_id=test_budget, category='groceries')
+        ).scalar_one()
+        assert item.amount == 500.0
+
+    def test_add_budget_item_with_new_category(self, logged_in_client, test_app, test_budget):
+        """Test adding budget item with new category."""
+        response = logged_in_client.post('/budget/items/add', data={
+            'category': '__new__',
+            'new_category': 'Pet Care',
+            'amount': 100.0
+        })
+
+        assert response.status_code == 302
+        db.session.execute(
+            select(BudgetItem).filter_by(budget_id=test_budget, category='pet_care')
+        ).scalar_one()
+
+    def test_add_budget_item_requires_budget(self, logged_in_client, test_app):
+        """Test that adding item requires existing budget."""
+        response = logged_in_client.post('/budget/items/add', data={
+            'category': 'groceries',
+            'amount': 500.0
+        })
+
+        # Should redirect to edit budget
+        assert_redirects(response, '/budget/edit')
+
+    def test_update_budget_item(self, call_view, test_budget):
+        """Test updating an existing budget item."""
+        # First add an item
+        item = BudgetItem(budget_id=test_budget, category='rent', amount=1000.0)
+        db.session.add(item)
+        db.session.commit()
+
+        # Update the item
+        response = call_view('edit_budget_item', form={'amount': 1200.0}, item_id=item.id)
+
+        assert response.status_code == 302
+
+        db.session.expire_all()
+        assert item.amount == 1200.0
+
+    def test_delete_budget_item(self, call_view, test_budget):
+        """Test deleting a budget item."""
+        item = BudgetItem(budget_id=test_budget, category='entertainment', amount=200.0)
+        db.session.add(item)
+        db.session.commit()
+        item_id = item.id
+
+        response = call_view('delete_budget_item', item_id=item_id)
+
+        assert response.status_code == 302
+
+        db.session.expire_all()
+        assert db.session.get(BudgetItem, item_id) is None
+
+    @pytest.mark.parametrize('action, data, message', [
+        ('edit', {'amount': 1200.0}, 'Budget for Rent updated!'),
+        ('delete', None, 'Budget for Rent deleted.'),
+    ])
+    def test_item_routes_over_http(self, logged_in_client, test_budget, flashes, action, data, message):
+        """Test the item edit and delete routes end to end, including their flash message."""
+        item = BudgetItem(budget_id=test_budget, category='rent', amount=1000.0)
+        db.session.add(item)
+        db.session.commit()
+
+        response = logged_in_client.post(f'/budget/items/{item.id}/{action}', data=data)
+
+        assert_redirects(response, '/budget')
+        assert ('success', message) in flashes(logged_in_client)
+
+    def test_flash_message_rendered(self, logged_in_client, test_app, test_budget):
+        """Test that the flash message is rendered on the budget page after a redirect."""
+        response = logged_in_client.post('/budget/items/add', data={
+            'category': 'groceries',
+            'amount': 500.0
+        }, follow_redirects=True)
+
+        assert response.status_code == 200
+        assert b'Budget for Groceries added!' in response.data
+
+    def test_edit_budget_item_not_owned(self, other_user_client, test_budget):
+        """Test that users cannot edit other users' budget items."""
+        item = BudgetItem(budget_id=test_budget, category='food', amount=300.0)
+        db.session.add(item)
+        db.session.commit()
+
+        response = other_user_client.get(f'/budget/items/{item.id}/edit', follow_redirects=True)
+        assert b'not found' in response.data.lower() or b'Budget' in response.data
+
+
+class TestAccountGoalsRoute:
+    """Tests for account goals (savings/investment targets)."""
+
+    @pytest.fixture(autouse=True)
+    def _ctx(self, test_app):
+        """Hold one app context open for the whole test."""
+        with test_app.app_context():
+            yield
+
+    @pytest.fixture
+    def savings_goal(self, test_budget, test_savings_account):
+        """Create a 500/month goal on the test savings account."""
+        goal = BudgetAccountGoal(
+            budget_id=test_budget,
+            account_id=test_savings_account,
+            monthly_goal=500.0
+        )
+        db.session.add(goal)
+        db.session.commit()
+        return goal.id
+
+    def test_add_account_goal(self, call_view, test_budget, test_savings_account):
+        """Test adding an account goal."""
+        response = call_view('add_account_goal', form={
+            'account_id': test_savings_account,
+            'monthly_goal': 500.0
+        })
+
+        assert_redirects(response, '/budget')
+
+        goal = db.session.execute(
+            select(BudgetAccountGoal).filter_by(budget_id=test_budget, account_id=test_savings_account)
+        ).scalar_one()
+        assert goal.monthly_goal == 500.0
+
+    def test_add_investment_goal(self, logged_in_client, test_budget, test_investment_account, flashes):
+        """Test adding an investment account goal."""
+        response = logged_in_client.post('/budget/account-goals/add', data={
+            'account_id': test_investment_account,
+            'monthly_goal': 1000.0
+        })
+
+        assert response.status_code == 302
+        assert ('success', 'Goal for Test 401k added!') in flashes(logged_in_client)
+
+        goal = db.session.execute(
+            select(BudgetAccountGoal).filter_by(budget_id=test_budget, account_id=test_investment_account)
+        ).scalar_one()
+        assert goal.monthly_goal == 1000.0
+
+    def test_update_account_goal(self, call_view, savings_goal):
+        """Test updating an account goal."""
+        response = call_view('edit_account_goal', form={'monthly_goal': 750.0}, goal_id=savings_goal)
+
+        assert response.status_code == 302
+
+        db.session.expire_all()
+        assert db.session.get(BudgetAccountGoal, savings_goal).monthly_goal == 750.0
+
+    def test_delete_account_goal(self, call_view, savings_goal):
+        """Test deleting an account goal."""
+        response = call_view('delete_account_goal', goal_id=savings_goal)
+
+        assert response.status_code == 302
+
+        db.session.expire_all()
+        assert db.session.get(BudgetAccountGoal, savings_goal) is None
+
+    @pytest.mark.parametrize('action, data, message', [
+        ('edit', {'monthly_goal': 750.0}, 'Goal for Test Savings updated!'),
+        ('delete', None, 'Goal for Test Savings deleted.'),
+    ])
+    def test_goal_routes_over_http(self, logged_in_client, savings_goal, flashes, action, data, message):
+        """Test the goal edit and delete routes end to end, including their flash message."""
+        response = logged_in_client.post(f'/budget/account-goals/{savings_goal}/{action}', data=data)
+
+        assert_redirects(response, '/budget')
+        assert ('success', message) in flashes(logged_in_client)
+
+
+class TestBudgetValidation:
+    """Tests for budget input validation."""
+
+    def test_budget_item_requires_positive_amount(self, logged_in_client, test_app, test_budget):
+        """Test that budget item requires positive amount."""
+        response = logged_in_client.post('/budget/items/add', data={
+            'category': 'groceries',
+            'amount': -100.0
+        }, follow_redirects=True)
+
+        assert b'positive' in response.data.lower() or response.status_code == 200
+
+    def test_account_goal_requires_positive_amount(self, logged_in_client, test_app, test_budget, test_savings_account):
+        """Test that account goal requires positive amount."""
+        response = logged_in_client.post('/budget/account-goals/add', data={
+            'account_id': test_savings_account,
+            'monthly_goal': -500.0
+        }, follow_redirects=True)
+
+        assert b'positive' in response.data.lower() or response.status_code == 200
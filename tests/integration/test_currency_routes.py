@@ -0,0 +1,107 @@
+"""
+Integration tests for currency summary, net worth and display currency routes.
+"""
+import pytest
+from models import Account, db
+
+
+class TestCurrencySummaryRoute:
+    """Tests for currency summary page."""
+
+    def test_currency_summary_loads(self, logged_in_client, test_app):
+        """Test that currency summary page loads."""
+        response = logged_in_client.get('/currency-summary')
+        assert response.status_code == 200
+
+    def test_currency_summary_groups_accounts(self, logged_in_client, test_app, test_user):
+        """Test that accounts are grouped by currency."""
+        with test_app.app_context():
+            db.session.bulk_insert_mappings(Account, [
+                {'user_id': test_user, 'name': 'USD Account', 'account_type': 'checking',
+                 'currency': 'USD', 'initial_balance': 1000.0},
+                {'user_id': test_user, 'name': 'INR Account', 'account_type': 'checking',
+                 'currency': 'INR', 'initial_balance': 80000.0},
+            ])
+            db.session.commit()
+
+        response = logged_in_client.get('/currency-summary')
+        assert response.status_code == 200
+        assert b'USD Account' in response.data
+        assert b'INR Account' in response.data
+
+
+class TestNetWorthRoute:
+    """Tests for net worth page."""
+
+    @pytest.fixture(autouse=True)
+    def _ctx(self, test_app):
+        """Hold one app context open for the whole test."""
+        with test_app.app_context():
+            yield
+
+    @pytest.fixture
+    def net_worth_setup(self, request, test_user):
+        """Seed the accounts named by the parametrized setup before loading /net-worth."""
+        rows = {
+            'none': [],
+            'assets': [
+                ('Checking', 'checking', 'USD', 5000.0),
+                ('Savings', 'savings', 'USD', 10000.0),
+                ('401k', 'investment', 'USD', 50000.0),
+            ],
+            'liabilities': [
+                ('Credit Card', 'credit_card', 'USD', -2000.0),
+                ('Car Loan', 'loan', 'USD', -15000.0),
+            ],
+            # ~10,000 USD at 83 rate
+            'inr': [('India Savings', 'savings', 'INR', 830000.0)],
+        }[request.param]
+        if rows:
+            db.session.bulk_insert_mappings(Account, [
+                {'user_id': test_user, 'name': name, 'account_type': account_type,
+                 'currency': currency, 'initial_balance': balance}
+                for name, account_type, currency, balance in rows
+            ])
+            db.session.commit()
+
+    @pytest.mark.parametrize('net_worth_setup', ['none', 'assets', 'liabilities', 'inr'], indirect=True)
+    def test_net_worth_loads(self, logged_in_client, net_worth_setup):
+        """Test that net worth page loads with assets, liabilities and INR accounts."""
+        response = logged_in_client.get('/net-worth')
+        assert response.status_code == 200
+
+    def test_net_worth_groups_by_account_type(self, logged_in_client, test_app, test_user):
+        """Test that accounts are grouped by type."""
+        db.session.bulk_insert_mappings(Account, [
+            {
+                'user_id': test_user,
+                'name': f'{account_type.title()} Account',
+                'account_type': account_type,
+                'currency': 'USD',
+                'initial_balance': 1000.0 if account_type not in ['credit_card', 'loan'] else -500.0
+            }
+            for account_type in Account.ACCOUNT_TYPES
+        ])
+        db.session.commit()
+
+        response = logged_in_client.get('/net-worth')
+        assert response.status_code == 200
+
+
+class TestDisplayCurrencyPreference:
+    """Tests for display currency preference."""
+
+    def test_dashboard_respects_currency_preference(self, logged_in_client, test_app, test_user, test_account):
+        """Test that dashboard respects user's display currency preference."""
+        # Set preference to INR
+        logged_in_client.get('/toggle-currency')
+
+        response = logged_in_client.get('/dashboard')
+        assert response.status_code == 200
+        # Should display values in INR
+
+    def test_accounts_page_shows_original_currency(self, logged_in_client, test_app, test_account):
+        """Test that account detail shows original currency."""
+        response = logged_in_client.get(f'/accounts/{test_account}')
+        assert response.status_code == 200
+        # Should show $ for USD account
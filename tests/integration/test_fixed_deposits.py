@@ -0,0 +1,451 @@
+"""
+Unit tests for the Fixed Deposit functionality.
+"""
+import pytest
+from datetime import timedelta
+from models import Account, FixedDeposit, Transaction, db
+from tests._asserts import assert_redirects, contains_any
+# The day the conftest's autouse today fixture freezes the clock at.
+from tests.integration.conftest import TODAY
+
+ONE_YEAR = timedelta(days=365)
+MATURITY = TODAY + ONE_YEAR
+
+# Never added to a session; repr only reads the principal and rate.
+REPR_FD = FixedDeposit(principal=100000.0, interest_rate=7.5)
+
+
+def build_fd(**overrides):
+    """Build an unsaved one-year 50,000 @ 7% FixedDeposit starting today, plus overrides.
+
+    Touches no database, so no_db tests can use it directly.
+    """
+    defaults = {
+        'principal': 50000.0,
+        'interest_rate': 7.0,
+        'start_date': TODAY,
+        'maturity_date': MATURITY,
+    }
+    return FixedDeposit(**{**defaults, **overrides})
+
+
+@pytest.fixture
+def fd_factory(request):
+    """Return a callable like build_fd that defaults to the test INR account.
+
+    The account is only created when neither account nor account_id is given.
+    """
+    def make(**overrides):
+        if 'account_id' not in overrides and 'account' not in overrides:
+            overrides['account_id'] = request.getfixturevalue('test_inr_account')
+        return build_fd(**overrides)
+
+    return make
+
+
+class TestFixedDepositModel:
+    """Tests for the FixedDeposit model."""
+
+    def test_fixed_deposit_creation(self, db_session, fd_factory):
+        """Test creating a fixed deposit."""
+        fd = fd_factory(interest_rate=7.5)
+        db_session.add(fd)
+        db_session.flush()
+
+        assert fd.id is not None
+        assert fd.principal == 50000.0
+        assert fd.interest_rate == 7.5
+        assert fd.is_matured is False
+
+    @pytest.fixture
+    def base_fd(self):
+        """Build an unsaved one-year 100,000 @ 7% deposit starting today.
+
+        The properties under test are computed from column values alone, so the
+        deposit is never inserted.
+        """
+        return build_fd(principal=100000.0)
+
+    # Compound interest (quarterly): A = P * (1 + r/4)^(4*t)
+    # Expected: 100000 * (1 + 0.07/4)^4 ≈ 107186, so interest ≈ 7186
+    @pytest.mark.parametrize('prop, expected, tol', [
+        ('maturity_value', 107186, 1),
+        ('interest_earned', 7186, 1),
+        ('days_to_maturity', 365, None),
+        ('is_past_maturity', False, None),
+    ])
+    @pytest.mark.no_db
+    def test_computed_properties(self, base_fd, prop, expected, tol):
+        """Test maturity value, interest earned, days to maturity and is_past_maturity."""
+        value = getattr(base_fd, prop)
+        assert value == (expected if tol is None else pytest.approx(expected, abs=tol))
+
+    @pytest.mark.no_db
+    def test_days_to_maturity_matured(self):
+        """Test days to maturity returns 0 when matured."""
+        fd = build_fd(
+            start_date=TODAY - ONE_YEAR,
+            maturity_date=TODAY - timedelta(days=1),
+            is_matured=True
+        )
+
+        assert fd.days_to_maturity == 0
+
+    @pytest.mark.no_db
+    def test_is_past_maturity(self):
+        """Test is_past_maturity is True once the maturity date has passed."""
+        fd = build_fd(
+            start_date=TODAY - ONE_YEAR,
+            maturity_date=TODAY - timedelta(days=1)
+        )
+
+        assert fd.is_past_maturity is True
+
+    @pytest.mark.no_db
+    def test_fixed_deposit_repr(self):
+        """Test FixedDeposit string representation."""
+        assert repr(REPR_FD) == '<FixedDeposit 100000.0 @ 7.5%>'
+
+
+class TestAccountFixedDepositProperties:
+    """Tests for Account model FD-related properties."""
+
+    def test_total_fixed_deposits_inr_account(self, db_session, test_user, fd_factory):
+        """Test total_fixed_deposits for INR account."""
+        account = Account(
+            user_id=test_user,
+            name='INR Test',
+            account_type='savings',
+            currency='INR',
+            initial_balance=200000.0
+        )
+        db_session.add_all([
+            account,
+            fd_factory(account=account),
+            fd_factory(account=account, principal=75000.0, interest_rate=7.5),
+        ])
+        db_session.flush()
+
+        assert account.total_fixed_deposits == 125000.0
+
+    def test_total_fixed_deposits_excludes_matured(self, db_session, test_user, fd_factory):
+        """Test that matured FDs are excluded from total."""
+        account = Account(
+            user_id=test_user,
+            name='INR Test',
+            account_type='savings',
+            currency='INR',
+            initial_balance=200000.0
+        )
+        fd_active = fd_factory(account=account, is_matured=False)
+        fd_matured = fd_factory(
+            account=account,
+            principal=75000.0,
+            interest_rate=7.5,
+            start_date=TODAY - ONE_YEAR,
+            maturity_date=TODAY,
+            is_matured=True
+        )
+        db_session.add_all([account, fd_active, fd_matured])
+        db_session.flush()
+
+        # Only active FD should be counted
+        assert account.total_fixed_deposits == 50000.0
+
+    def test_total_fixed_deposits_usd_account(self, db_session, test_user):
+        """Test that USD accounts return 0 for fixed deposits."""
+        account = Account(
+            user_id=test_user,
+            name='USD Test',
+            account_type='savings',
+            currency='USD',
+            initial_balance=5000.0
+        )
+        db_session.add(account)
+        db_session.flush()
+
+        assert account.total_fixed_deposits == 0.0
+
+    def test_total_value(self, db_session, test_user, fd_factory):
+        """Test total_value includes FD principal."""
+        account = Account(
+            user_id=test_user,
+            name='INR Test',
+            account_type='savings',
+            currency='INR',
+            initial_balance=100000.0
+        )
+        db_session.add_all([account, fd_factory(account=account)])
+        db_session.flush()
+
+        # total_value = current_balance (100000) + fd_principal (50000)
+        assert account.total_value == 150000.0
+
+
+class TestFixedDepositRoutes:
+    """Tests for Fixed Deposit routes."""
+
+    @pytest.fixture(autouse=True)
+    def _ctx(self, test_app):
+        """Hold one app context open for the whole test."""
+        with test_app.app_context():
+            yield
+
+    def test_fixed_deposits_page_loads(self, logged_in_client, test_app):
+        """Test that fixed deposits page loads."""
+        response = logged_in_client.get('/fixed-deposits')
+        assert response.status_code == 200
+        assert b'Fixed Deposits' in response.data
+
+    def test_add_fixed_deposit_requires_inr_account(self, logged_in_client):
+        """Test that adding FD redirects to account creation when no INR account exists."""
+        response = logged_in_client.get('/fixed-deposits/add')
+        assert_redirects(response, '/accounts/add')
+
+    def test_add_fixed_deposit_form_loads(self, logged_in_client, test_app, test_inr_account):
+        """Test that add FD form loads when INR account exists."""
+        response = logged_in_client.get('/fixed-deposits/add')
+        assert response.status_code == 200
+        assert contains_any(response.data, b'Principal', b'Interest Rate')
+
+    def test_add_fixed_deposit(self, logged_in_client, test_app, test_inr_account, flashes):
+        """Test adding a fixed deposit."""
+        response = logged_in_client.post('/fixed-deposits/add', data={
+            'account_id': test_inr_account,
+            'principal': 100000,
+            'interest_rate': 7.5,
+            'start_date': TODAY.isoformat(),
+            'maturity_date': MATURITY.isoformat(),
+            'bank_name': 'SBI',
+            'fd_number': 'FD123456'
+        })
+
+        assert_redirects(response, '/fixed-deposits')
+        assert ('success', 'Fixed Deposit of ₹100,000.00 added successfully!') in flashes(logged_in_client)
+
+        # The route redirects to the deposit list, not the new deposit, so find
+        # it by its number; .one() also fails if a duplicate was inserted.
+        fd = FixedDeposit.query.filter_by(account_id=test_inr_account, fd_number='FD123456').one()
+        assert fd.principal == 100000.0
+
+    def test_fixed_deposit_detail_page(self, logged_in_client, test_app, test_fixed_deposit):
+        """Test fixed deposit detail page loads."""
+        response = logged_in_client.get(f'/fixed-deposits/{test_fixed_deposit}')
+        assert response.status_code == 200
+        assert contains_any(response.data, b'Principal', b'Maturity')
+
+    def test_edit_fixed_deposit(self, logged_in_client, test_app, test_fixed_deposit, test_inr_account, flashes):
+        """Test editing a fixed deposit."""
+        response = logged_in_client.post(f'/fixed-deposits/{test_fixed_deposit}/edit', data={
+            'account_id': test_inr_account,
+            'bank_name': 'HDFC Bank',
+            'fd_number': 'NEW123',
+            'is_matured': '0'
+        })
+
+        assert_redirects(response, '/fixed-deposits')
+        assert ('success', 'Fixed deposit updated successfully!') in flashes(logged_in_client)
+
+        db.session.expire_all()
+        fd = db.session.get(FixedDeposit, test_fixed_deposit)
+        assert fd.bank_name == 'HDFC Bank'
+        assert fd.fd_number == 'NEW123'
+
+    def test_delete_fixed_deposit(self, logged_in_client, test_app, fd_factory, flashes):
+        """Test deleting a fixed deposit."""
+        # Create FD to delete
+        fd = fd_factory()
+        db.session.add(fd)
+        db.session.commit()
+        fd_id = fd.id
+
+        response = logged_in_client.post(f'/fixed-deposits/{fd_id}/delete')
+        assert_redirects(response, '/fixed-deposits')
+        assert ('success', 'Fixed deposit of ₹50,000.00 deleted.') in flashes(logged_in_client)
+
+        db.session.expire_all()
+        assert db.session.get(FixedDeposit, fd_id) is None
+
+    def test_mark_fd_matured(self, logged_in_client, test_app, fd_factory, flashes):
+        """Test marking FD as matured."""
+        fd = fd_factory(
+            start_date=TODAY - ONE_YEAR,
+            maturity_date=TODAY - timedelta(days=1)
+        )
+        db.session.add(fd)
+        db.session.commit()
+        fd_id = fd.id
+
+        response = logged_in_client.post(f'/fixed-deposits/{fd_id}/mark-matured')
+        assert_redirects(response, '/fixed-deposits')
+        category, message = flashes(logged_in_client)[-1]
+        assert category == 'success'
+        assert message.startswith('Fixed deposit marked as matured.')
+
+        db.session.expire_all()
+        fd = db.session.get(FixedDeposit, fd_id)
+        assert fd.is_matured is True
+
+
+class TestFixedDepositValidation:
+    """Tests for FD form validation."""
+
+    def test_maturity_date_after_start_date(self, logged_in_client, test_app, test_inr_account):
+        """Test that maturity date must be after start date."""
+        response = logged_in_client.post('/fixed-deposits/add', data={
+            'account_id': test_inr_account,
+            'principal': 50000,
+            'interest_rate': 7.0,
+            'start_date': TODAY.isoformat(),
+            'maturity_date': (TODAY - timedelta(days=1)).isoformat()
+        })
+
+        # Should stay on form with error
+        assert b'after start date' in response.data or response.status_code == 200
+
+    def test_minimum_principal(self, logged_in_client, test_app, test_inr_account):
+        """Test minimum principal validation."""
+        response = logged_in_client.post('/fixed-deposits/add', data={
+            'account_id': test_inr_account,
+            'principal': 500,  # Below minimum of 1000
+            'interest_rate': 7.0,
+            'start_date': TODAY.isoformat(),
+            'maturity_date': MATURITY.isoformat()
+        })
+
+        assert contains_any(response.data, b'1,000', b'Minimum')
+
+
+class TestCascadeDelete:
+    """Tests for FD cascade delete behavior."""
+
+    def test_account_delete_cascades_fixed_deposits(self, db_session, test_user, fd_factory):
+        """Test that deleting an account deletes its fixed deposits."""
+        account = Account(
+            user_id=test_user,
+            name='Cascade Test',
+            account_type='savings',
+            currency='INR',
+            initial_balance=100000.0
+        )
+        fd = fd_factory(account=account)
+        db_session.add_all([account, fd])
+        db_session.commit()
+        fd_id = fd.id
+
+        # Delete account
+        db_session.delete(account)
+        db_session.commit()
+
+        # FD should be deleted
+        assert db_session.get(FixedDeposit, fd_id) is None
+
+
+class TestFixedDepositDebitFromAccount:
+    """Tests for debit from account feature when creating FDs."""
+
+    @pytest.fixture(autouse=True)
+    def _ctx(self, test_app):
+        """Hold one app context open for the whole test."""
+        with test_app.app_context():
+            yield
+
+    def test_add_fd_with_debit_creates_transaction(self, logged_in_client, test_app, test_inr_account):
+        """Test that adding FD with debit_from_account creates a debit transaction."""
+        response = logged_in_client.post('/fixed-deposits/add', data={
+            'account_id': test_inr_account,
+            'principal': 100000,
+            'interest_rate': 7.5,
+            'start_date': TODAY.isoformat(),
+            'maturity_date': MATURITY.isoformat(),
+            'bank_name': 'SBI',
+            'fd_number': 'FD999',
+            'debit_from_account': 'y'
+        })
+
+        assert_redirects(response, '/fixed-deposits')
+
+        # Check FD was created
+        fd = FixedDeposit.query.filter_by(account_id=test_inr_account, fd_number='FD999').one()
+        assert fd.principal == 100000.0
+
+        # Check transaction was created
+        transaction = Transaction.query.filter_by(
+            account_id=test_inr_account,
+            amount=-100000.0,  # Negative for debit
+            category='transfer'
+        ).one()
+        assert 'Fixed Deposit' in transaction.description
+        assert 'SBI' in transaction.description
+        assert 'FD999' in transaction.description
+
+    def test_add_fd_without_debit_no_transaction(self, logged_in_client, test_app, test_inr_account):
+        """Test that adding FD without debit_from_account doesn't create a transaction."""
+        # Count existing transactions
+        initial_count = Transaction.query.filter_by(account_id=test_inr_account).count()
+
+        response = logged_in_client.post('/fixed-deposits/add', data={
+            'account_id': test_inr_account,
+            'principal': 50000,
+            'interest_rate': 6.5,
+            'start_date': TODAY.isoformat(),
+            'maturity_date': (TODAY + timedelta(days=180)).isoformat(),
+            'bank_name': 'HDFC',
+            'fd_number': 'FD888'
+            # No debit_from_account field - checkbox unchecked
+        }, follow_redirects=True)
+
+        assert response.status_code == 200
+
+        # Check FD was created
+        fd = FixedDeposit.query.filter_by(fd_number='FD888').first()
+        assert fd is not None
+
+        # Check no new transaction was created
+        final_count = Transaction.query.filter_by(account_id=test_inr_account).count()
+        assert final_count == initial_count
+
+    def test_add_fd_debit_transaction_date_matches_start_date(self, logged_in_client, test_app, test_inr_account):
+        """Test that debit transaction date matches FD start date."""
+        start_date = TODAY - timedelta(days=10)  # Start date in the past
+
+        response = logged_in_client.post('/fixed-deposits/add', data={
+            'account_id': test_inr_account,
+            'principal': 75000,
+            'interest_rate': 7.0,
+            'start_date': start_date.isoformat(),
+            'maturity_date': (start_date + ONE_YEAR).isoformat(),
+            'bank_name': 'ICICI',
+            'fd_number': 'FD777',
+            'debit_from_account': 'y'
+        }, follow_redirects=True)
+
+        assert response.status_code == 200
+
+        transaction = Transaction.query.filter_by(
+            account_id=test_inr_account,
+            amount=-75000.0,
+            category='transfer'
+        ).one()
+        assert 'ICICI' in transaction.description
+        assert transaction.transaction_date == start_date
+
+    def test_add_fd_debit_without_bank_info(self, logged_in_client, test_app, test_inr_account):
+        """Test debit transaction description without bank name and FD number."""
+        response = logged_in_client.post('/fixed-deposits/add', data={
+            'account_id': test_inr_account,
+            'principal': 25000,
+            'interest_rate': 6.0,
+            'start_date': TODAY.isoformat(),
+            'maturity_date': (TODAY + timedelta(days=90)).isoformat(),
+            'debit_from_account': 'y'
+        }, follow_redirects=True)
+
+        assert response.status_code == 200
+
+        transaction = Transaction.query.filter_by(
+            account_id=test_inr_account,
+            amount=-25000.0,
+            category='transfer'
+        ).one()
+        assert transaction.description == 'Fixed Deposit'
@@ -0,0 +1,200 @@
+"""
+Unit tests for form validation.
+"""
+import pytest
+from datetime import date
+from forms import (
+    LoginForm, SignupForm, AccountForm, TransactionForm,
+    TransferForm, UpdateBalanceForm, EditAccountForm, BudgetForm
+)
+from models import User, db
+
+
+@pytest.fixture(scope='module', autouse=True)
+def _ctx(test_app):
+    """Hold one app and request context open for every form test in the module.
+
+    Forms only read the request context to find form data and the CSRF
+    setting; no test here changes request state.
+    """
+    with test_app.app_context(), test_app.test_request_context():
+        yield
+
+
+class TestLoginForm:
+    """Tests for LoginForm validation."""
+
+    @pytest.fixture(scope='class')
+    @classmethod
+    def form(cls):
+        """Build one LoginForm for the class; each case sets its field data."""
+        return LoginForm()
+
+    @pytest.mark.parametrize('data, valid, error_field', [
+        ({'email': 'test@example.com', 'password': 'password123'}, True, None),
+        ({'email': '', 'password': 'password123'}, False, 'email'),
+        ({'email': 'notanemail', 'password': 'password123'}, False, 'email'),
+        ({'email': 'test@example.com', 'password': ''}, False, 'password'),
+    ], ids=['valid', 'email_required', 'email_format', 'password_required'])
+    def test_login_form(self, form, data, valid, error_field):
+        """Test login form validation and the field an invalid form fails on."""
+        for name, value in data.items():
+            form[name].data = value
+        assert form.validate() is valid
+        if error_field:
+            assert error_field in form.errors
+
+
+class TestSignupForm:
+    """Tests for SignupForm validation."""
+
+    @pytest.fixture(scope='class')
+    @classmethod
+    def form(cls):
+        """Build one SignupForm for the class; each case sets its field data."""
+        return SignupForm()
+
+    # test@example.com is the shared test user, seeded before every test.
+    @pytest.mark.parametrize('data, valid, error_field', [
+        ({'email': 'newuser@example.com', 'password': 'password123', 'confirm_password': 'password123'},
+         True, None),
+        ({'email': 'test@example.com', 'password': 'password123', 'confirm_password': 'differentpassword'},
+         False, 'confirm_password'),
+        ({'email': 'test@example.com', 'password': '12345', 'confirm_password': '12345'},
+         False, 'password'),
+        ({'email': 'test@example.com', 'password': 'password123', 'confirm_password': 'password123'},
+         False, 'email'),
+    ], ids=['valid', 'password_mismatch', 'password_too_short', 'duplicate_email'])
+    def test_signup_form(self, form, data, valid, error_field):
+        """Test signup form validation and the field an invalid form fails on."""
+        for name, value in data.items():
+            form[name].data = value
+        assert form.validate() is valid
+        if error_field:
+            assert error_field in form.errors
+
+
+class TestAccountForm:
+    """Tests for AccountForm validation."""
+
+    def test_valid_account_form(self):
+        """Test valid account form data."""
+        form = AccountForm(data={
+            'name': 'My Account',
+            'account_type': 'checking',
+            'currency': 'USD',
+            'initial_balance': 1000.0
+        })
+        # SelectField choices are predefined in the form class
+        assert form.name.data == 'My Account'
+        assert form.account_type.data == 'checking'
+
+    @pytest.mark.parametrize('field, value', [
+        ('name', ''),
+        ('account_type', ''),
+    ])
+    def test_account_field_required(self, field, value):
+        """Test that account name and type are required."""
+        data = {'name': 'Test', 'account_type': 'checking', 'currency': 'USD', 'initial_balance': 0}
+        form = AccountForm(data={**data, field: value})
+        assert form.validate() is False
+        assert field in form.errors
+
+    def test_account_allows_negative_balance(self):
+        """Test that negative initial balance is allowed (for credit cards)."""
+        form = AccountForm(data={
+            'name': 'Credit Card',
+            'account_type': 'credit_card',
+            'currency': 'USD',
+            'initial_balance': -500.0
+        })
+        # Verify negative balance is accepted
+        assert form.initial_balance.data == -500.0
+
+
+class TestTransactionForm:
+    """Tests for TransactionForm validation."""
+
+    @pytest.mark.parametrize('overrides, error_field', [
+        ({'amount': None}, 'amount'),
+        # Negative not allowed in form; the sign is determined by the type
+        ({'amount': -50.0}, 'amount'),
+        ({'description': ''}, 'description'),
+    ], ids=['amount_required', 'amount_positive', 'description_required'])
+    def test_invalid_transaction_form(self, overrides, error_field):
+        """Test that amount is required and positive and description is required."""
+        form = TransactionForm(data={
+            'account_id': 1,
+            'transaction_type': 'expense',
+            'amount': 50.0,
+            'description': 'Test',
+            'category': 'other',
+            'transaction_date': date.today(),
+            **overrides
+        })
+        form.account_id.choices = [(1, 'Test Account')]
+        form.category.choices = [('other', 'Other')]
+        assert form.validate() is False
+        assert error_field in form.errors
+
+
+class TestTransferForm:
+    """Tests for TransferForm validation."""
+
+    @pytest.mark.parametrize('amount, valid', [
+        (100.0, True),
+        (-100.0, False),
+    ])
+    def test_transfer_form(self, amount, valid):
+        """Test a valid transfer and that the transfer amount must be positive."""
+        form = TransferForm(data={
+            'from_account_id': 1,
+            'to_account_id': 2,
+            'amount': amount,
+            'description': 'Transfer',
+            'transfer_date': date.today()
+        })
+        form.from_account_id.choices = [(1, 'Account 1'), (2, 'Account 2')]
+        form.to_account_id.choices = [(1, 'Account 1'), (2, 'Account 2')]
+        assert form.validate() is valid
+
+
+class TestBudgetForm:
+    """Tests for BudgetForm validation."""
+
+    def test_valid_budget_form(self):
+        """Test valid budget form data."""
+        form = BudgetForm(data={
+            'name': 'Monthly Budget',
+            'expected_income': 5000.0,
+            'expected_savings': 500.0,
+            'expected_investments': 1000.0,
+            'currency': 'USD'
+        })
+        # Verify data is properly set
+        assert form.name.data == 'Monthly Budget'
+        assert form.expected_income.data == 5000.0
+
+    def test_budget_name_required(self):
+        """Test that budget name is required."""
+        form = BudgetForm(data={
+            'name': '',
+            'expected_income': 5000.0,
+            'expected_savings': 500.0,
+            'expected_investments': 1000.0,
+            'currency': 'USD'
+        })
+        assert form.validate() is False
+
+    def test_budget_allows_zero_values(self):
+        """Test that zero values are allowed for optional fields."""
+        form = BudgetForm(data={
+            'name': 'Basic Budget',
+            'expected_income': 0,
+            'expected_savings': 0,
+            'expected_investments': 0,
+            'currency': 'USD'
+        })
+        # Verify zero values are accepted
+        assert form.expected_income.data == 0
+        assert form.expected_savings.data == 0
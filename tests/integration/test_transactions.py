@@ -0,0 +1,338 @@
+"""
+Integration tests for transaction routes.
+"""
+import pytest
+from models import Transaction, Account, Category, db
+from tests._asserts import assert_redirects, contains_any, count_queries
+
+
+class TestAddTransactionRoute:
+    """Tests for adding transactions."""
+
+    def test_add_transaction_page_loads(self, logged_in_client, test_account):
+        """Test that add transaction page loads."""
+        response = logged_in_client.get('/transactions/add')
+        assert response.status_code == 200
+        assert contains_any(response.data, b'Add Transaction', b'Transaction')
+
+    def test_add_transaction_redirect_without_accounts(self, logged_in_client):
+        """Test redirect to add account when no accounts exist."""
+        response = logged_in_client.get('/transactions/add')
+        assert_redirects(response, '/accounts/add')
+
+    @pytest.mark.parametrize('form, amount, personal_amount', [
+        # Expenses are stored negative, income positive
+        ({'transaction_type': 'expense', 'amount': 50.0, 'description': 'Coffee', 'category': 'dining'},
+         -50.0, -50.0),
+        ({'transaction_type': 'income', 'amount': 3000.0, 'description': 'Salary', 'category': 'salary'},
+         3000.0, 3000.0),
+        # my_share takes the sign of the amount and becomes the personal amount
+        ({'transaction_type': 'expense', 'amount': 100.0, 'my_share': 50.0, 'description': 'Shared dinner',
+          'category': 'dining'},
+         -100.0, -50.0),
+    ], ids=['expense', 'income', 'my_share'])
+    def test_add_transaction(self, logged_in_client, test_account, flashes, today, form, amount, personal_amount):
+        """Test adding expense, income and shared transactions."""
+        response = logged_in_client.post('/transactions/add', data={
+            'account_id': test_account,
+            'transaction_date': today.isoformat(),
+            **form
+        })
+
+        assert_redirects(response, f'/accounts/{test_account}')
+        assert ('success', 'Transaction added successfully!') in flashes(logged_in_client)
+
+        # The route redirects to the account, not the new transaction, so find it
+        # by account and description; .one() also fails on a duplicate insert.
+        transaction = Transaction.query.filter_by(account_id=test_account, description=form['description']).one()
+        assert transaction.amount == amount
+        assert transaction.personal_amount == personal_amount
+
+    def test_add_transaction_with_new_category(self, logged_in_client, test_account, today):
+        """Test adding a transaction with a new custom category."""
+        response = logged_in_client.post('/transactions/add', data={
+            'account_id': test_account,
+            'transaction_type': 'expense',
+            'amount': 25.0,
+            'description': 'Pet food',
+            'category': '__new__',
+            'new_category': 'Pet Expenses',
+            'transaction_date': today.isoformat()
+        })
+
+        assert_redirects(response, f'/accounts/{test_account}')
+
+        transaction = Transaction.query.filter_by(account_id=test_account, description='Pet food').one()
+        assert transaction.category == 'pet_expenses'
+
+        # Check category was created
+        category = Category.query.filter_by(name='pet_expenses').first()
+        assert category is not None
+
+    def test_add_transaction_preselects_account(self, logged_in_client, test_account):
+        """Test that account is pre-selected when passed as query param."""
+        response = logged_in_client.get(f'/transactions/add?account_id={test_account}')
+        assert response.status_code == 200
+        # The account should be pre-selected in the form
+
+    def test_add_transaction_invalid_account(self, logged_in_client, test_user, today):
+        """Test adding transaction with invalid account."""
+        response = logged_in_client.post('/transactions/add', data={
+            'account_id': 99999,  # Invalid account
+            'transaction_type': 'expense',
+            'amount': 50.0,
+            'description': 'Test',
+            'category': 'other',
+            'transaction_date': today.isoformat()
+        })
+
+        # The user has no accounts at all, so the route sends them to create one
+        assert_redirects(response, '/accounts/add')
+
+
+class TestEditTransactionRoute:
+    """Tests for editing transactions."""
+
+    def test_edit_transaction_page_loads(self, logged_in_client, test_transaction):
+        """Test that edit transaction page loads."""
+        response = logged_in_client.get(f'/transactions/{test_transaction}/edit')
+        assert response.status_code == 200
+
+    def test_edit_transaction_amount(self, logged_in_client, test_transaction, test_account, today):
+        """Test editing transaction amount."""
+        response = logged_in_client.post(f'/transactions/{test_transaction}/edit', data={
+            'account_id': test_account,
+            'transaction_type': 'expense',
+            'amount': 75.0,
+            'description': 'Updated expense',
+            'category': 'groceries',
+            'transaction_date': today.isoformat()
+        }, follow_redirects=True)
+
+        assert response.status_code == 200
+        assert b'updated successfully' in response.data
+
+        db.session.expire_all()
+        transaction = db.session.get(Transaction, test_transaction)
+        assert transaction.amount == -75.0
+        assert transaction.description == 'Updated expense'
+
+    def test_edit_transaction_type_to_income(self, logged_in_client, test_transaction, test_account, today):
+        """Test changing transaction from expense to income."""
+        response = logged_in_client.post(f'/transactions/{test_transaction}/edit', data={
+            'account_id': test_account,
+            'transaction_type': 'income',
+            'amount': 50.0,
+            'description': 'Now income',
+            'category': 'income',
+            'transaction_date': today.isoformat()
+        })
+
+        assert_redirects(response, f'/accounts/{test_account}')
+
+        db.session.expire_all()
+        transaction = db.session.get(Transaction, test_transaction)
+        assert transaction.amount == 50.0  # Now positive
+
+    def test_edit_transaction_not_found(self, logged_in_client):
+        """Test editing non-existent transaction."""
+        response = logged_in_client.get('/transactions/99999/edit')
+        assert response.status_code == 404
+
+    def test_edit_other_users_transaction(self, other_user_client, test_transaction):
+        """Test that users cannot edit other users' transactions."""
+        response = other_user_client.get(f'/transactions/{test_transaction}/edit', follow_redirects=True)
+        assert b'not found' in response.data.lower() or b'Dashboard' in response.data
+
+
+class TestDeleteTransactionRoute:
+    """Tests for deleting transactions."""
+
+    def test_delete_transaction(self, logged_in_client, test_transaction, test_account):
+        """Test deleting a transaction."""
+        response = logged_in_client.post(f'/transactions/{test_transaction}/delete', follow_redirects=True)
+
+        assert response.status_code == 200
+        assert b'deleted successfully' in response.data
+
+        db.session.expire_all()
+        transaction = db.session.get(Transaction, test_transaction)
+        assert transaction is None
+
+    def test_delete_transaction_updates_balance(self, logged_in_client, test_account, today):
+        """Test that deleting transaction updates account balance."""
+        account = db.session.get(Account, test_account)
+        initial_balance = account.current_balance
+
+        # Add a transaction
+        t = Transaction(
+            account_id=test_account,
+            amount=-100.0,
+            description='To delete',
+            category='other',
+            transaction_date=today
+        )
+        db.session.add(t)
+        db.session.commit()
+        trans_id = t.id
+
+        # Balance should have decreased
+        assert account.current_balance == initial_balance - 100.0
+
+        # Delete the transaction
+        logged_in_client.post(f'/transactions/{trans_id}/delete')
+
+        db.session.expire_all()
+        with count_queries(db.engine) as queries:
+            # Balance should be restored
+            assert account.current_balance == initial_balance
+        # At most one reload of the account and one SUM; the transactions are never loaded
+        assert len(queries) <= 2
+
+
+class TestTransferRoute:
+    """Tests for transfers between accounts."""
+
+    def test_transfer_page_loads(self, logged_in_client, test_account, test_savings_account):
+        """Test that transfer page loads when user has multiple accounts."""
+        response = logged_in_client.get('/transfer')
+        assert response.status_code == 200
+
+    def test_transfer_requires_two_accounts(self, logged_in_client, test_account):
+        """Test that transfer requires at least 2 accounts."""
+        response = logged_in_client.get('/transfer')
+        assert_redirects(response, '/accounts/add')
+
+    def test_successful_transfer(self, logged_in_client, test_account, test_savings_account, today):
+        """Test successful transfer between accounts."""
+        checking = db.session.get(Account, test_account)
+        savings = db.session.get(Account, test_savings_account)
+        checking_balance = checking.current_balance
+        savings_balance = savings.current_balance
+
+        response = logged_in_client.post('/transfer', data={
+            'from_account_id': test_account,
+            'to_account_id': test_savings_account,
+            'amount': 200.0,
+            'description': 'Monthly savings',
+            'transfer_date': today.isoformat()
+        }, follow_redirects=True)
+
+        assert response.status_code == 200
+        assert b'transferred' in response.data.lower()
+
+        db.session.expire_all()
+        with count_queries(db.engine) as queries:
+            assert checking.current_balance == checking_balance - 200.0
+            assert savings.current_balance == savings_balance + 200.0
+        # At most one reload and one SUM per account
+        assert len(queries) <= 4
+
+    def test_transfer_creates_two_transactions(self, logged_in_client, test_account, test_savings_account, today):
+        """Test that transfer creates paired transactions."""
+        logged_in_client.post('/transfer', data={
+            'from_account_id': test_account,
+            'to_account_id': test_savings_account,
+            'amount': 100.0,
+            'description': 'Test transfer',
+            'transfer_date': today.isoformat()
+        })
+
+        legs = Transaction.query.filter(
+            Transaction.account_id.in_([test_account, test_savings_account]),
+            Transaction.category == 'transfer'
+        ).all()
+        # One outgoing leg on checking and one incoming leg on savings
+        assert sorted((t.account_id, t.amount) for t in legs) == sorted([
+            (test_account, -100.0),
+            (test_savings_account, 100.0),
+        ])
+
+    def test_transfer_to_same_account(self, logged_in_client, test_account, test_savings_account, today):
+        """Test that transfer to same account is rejected."""
+        response = logged_in_client.post('/transfer', data={
+            'from_account_id': test_account,
+            'to_account_id': test_account,
+            'amount': 100.0,
+            'description': 'Invalid',
+            'transfer_date': today.isoformat()
+        }, follow_redirects=True)
+
+        # Should show error message about same account
+        assert b'same account' in response.data.lower() or response.status_code == 200
+
+
+class TestMonthlyReportRoute:
+    """Tests for monthly report."""
+
+    def test_monthly_report_loads(self, logged_in_client, test_account):
+        """Test that monthly report page loads."""
+        response = logged_in_client.get('/reports/monthly')
+        assert response.status_code == 200
+
+    def test_monthly_report_with_transactions(self, logged_in_client, test_account, today):
+        """Test monthly report shows transaction data."""
+        # Add some transactions for this month
+        t1 = Transaction(
+            account_id=test_account,
+            amount=5000.0,
+            description='Salary',
+            category='salary',
+            transaction_date=today
+        )
+        t2 = Transaction(
+            account_id=test_account,
+            amount=-200.0,
+            description='Groceries',
+            category='groceries',
+            transaction_date=today
+        )
+        db.session.bulk_save_objects([t1, t2])
+        db.session.commit()
+
+        response = logged_in_client.get('/reports/monthly')
+        assert response.status_code == 200
+        # Should show expense categories
+
+    def test_monthly_report_different_month(self, logged_in_client, test_account):
+        """Test viewing report for different month."""
+        response = logged_in_client.get('/reports/monthly?year=2024&month=1')
+        assert response.status_code == 200
+
+
+class TestDashboardTransactions:
+    """Tests for dashboard transaction display."""
+
+    def test_dashboard_shows_recent_transactions(self, logged_in_client, test_account, today):
+        """Test that dashboard shows recent transactions."""
+        db.session.bulk_save_objects([
+            Transaction(
+                account_id=test_account,
+                amount=-10.0 * (i + 1),
+                description=f'Transaction {i}',
+                category='other',
+                transaction_date=today
+            )
+            for i in range(5)
+        ])
+        db.session.commit()
+
+        response = logged_in_client.get('/dashboard')
+        assert response.status_code == 200
+        assert b'Transaction' in response.data
+
+    def test_dashboard_monthly_expenses(self, logged_in_client, test_account, today):
+        """Test that dashboard calculates monthly expenses."""
+        t = Transaction(
+            account_id=test_account,
+            amount=-500.0,
+            description='Big purchase',
+            category='shopping',
+            transaction_date=today
+        )
+        db.session.add(t)
+        db.session.commit()
+
+        response = logged_in_client.get('/dashboard')
+        assert response.status_code == 200
+        # Dashboard should show monthly expenses
@@ -0,0 +1 @@
+# Unit tests: pure functions, no Flask app or database
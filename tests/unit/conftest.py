@@ -0,0 +1,20 @@
+"""
+Fixtures for unit tests. Deliberately does not import the Flask app or touch a database.
+"""
+import pytest
+
+from currency import DEFAULT_EXCHANGE_RATE, _rate_cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_cache():
+    """Start every test from a cold exchange rate cache and restore it afterwards.
+
+    A cold cache holds the default rate and no timestamp, so the next
+    get_exchange_rate() call goes to the API.
+    """
+    saved = _rate_cache.copy()
+    _rate_cache.update(rate=DEFAULT_EXCHANGE_RATE, last_updated=None)
+    yield
+    _rate_cache.clear()
+    _rate_cache.update(saved)
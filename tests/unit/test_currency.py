@@ -0,0 +1,120 @@
+"""
+Unit tests for currency conversion and related features.
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+from datetime import datetime, timedelta
+from currency import (
+    get_exchange_rate,
+    convert_currency,
+    format_currency,
+    get_currency_symbol,
+    DEFAULT_EXCHANGE_RATE,
+    _rate_cache
+)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Freeze currency's clock at a fixed instant and return that instant."""
+    fake = datetime(2024, 1, 1, 12, 0, 0)
+    monkeypatch.setattr('currency.datetime', SimpleNamespace(now=lambda: fake))
+    return fake
+
+
+class TestGetExchangeRate:
+    """Tests for exchange rate fetching."""
+
+    def test_returns_cached_rate(self, frozen_now):
+        """Test that cached rate is returned if recent."""
+        _rate_cache.update(rate=85.0, last_updated=frozen_now)
+        rate = get_exchange_rate()
+        assert rate == 85.0
+
+    @pytest.mark.parametrize('age, expected', [
+        (timedelta(minutes=59), 85.0),
+        (timedelta(hours=1), 84.5),
+    ])
+    @patch('currency.requests.get')
+    def test_cache_expires_after_an_hour(self, mock_get, frozen_now, age, expected):
+        """Test that a cached rate is reused for under an hour, then refetched."""
+        mock_get.return_value = SimpleNamespace(
+            status_code=200,
+            json=lambda: {'rates': {'INR': 84.5}}
+        )
+        _rate_cache.update(rate=85.0, last_updated=frozen_now - age)
+
+        assert get_exchange_rate() == expected
+
+    def test_returns_default_on_api_failure(self):
+        """Test fallback to default rate on API failure."""
+        with patch('currency.requests.get') as mock_get:
+            mock_get.side_effect = Exception('Network error')
+            rate = get_exchange_rate()
+            assert rate == DEFAULT_EXCHANGE_RATE
+
+    @patch('currency.requests.get')
+    def test_updates_cache_on_success(self, mock_get, frozen_now):
+        """Test that cache is updated on successful API call."""
+        mock_get.return_value = SimpleNamespace(
+            status_code=200,
+            json=lambda: {'rates': {'INR': 84.5}}
+        )
+
+        rate = get_exchange_rate()
+        assert rate == 84.5
+        assert _rate_cache['rate'] == 84.5
+        assert _rate_cache['last_updated'] == frozen_now
+
+
+class TestConvertCurrency:
+    """Tests for currency conversion."""
+
+    @pytest.fixture(autouse=True, scope='class')
+    @classmethod
+    def fixed_rate(cls):
+        """Pin the exchange rate so conversions never touch the rate cache."""
+        with patch('currency.get_exchange_rate', return_value=83.0):
+            yield
+
+    @pytest.mark.parametrize('amount, from_currency, to_currency, expected', [
+        (100.0, 'USD', 'USD', 100.0),
+        (5000.0, 'INR', 'INR', 5000.0),
+        (100.0, 'USD', 'INR', 8300.0),
+        (8300.0, 'INR', 'USD', 100.0),
+        (-100.0, 'USD', 'INR', -8300.0),
+        (0, 'USD', 'INR', 0),
+    ])
+    def test_convert_currency(self, amount, from_currency, to_currency, expected):
+        """Test same-currency, USD/INR, negative and zero conversions."""
+        assert convert_currency(amount, from_currency, to_currency) == expected
+
+
+class TestFormatCurrency:
+    """Tests for currency formatting."""
+
+    @pytest.mark.parametrize('amount, currency, expected', [
+        (1234.56, 'USD', '$1,234.56'),
+        (1000000.00, 'USD', '$1,000,000.00'),
+        (1234.56, 'INR', '₹1,234.56'),
+        (100.00, None, '$100.00'),
+        (100.00, 'XYZ', '$100.00'),
+    ])
+    def test_format_currency(self, amount, currency, expected):
+        """Test USD, INR, default (USD) and unknown (defaults to $) formatting."""
+        formatted = format_currency(amount) if currency is None else format_currency(amount, currency)
+        assert formatted == expected
+
+
+class TestGetCurrencySymbol:
+    """Tests for currency symbol retrieval."""
+
+    @pytest.mark.parametrize('currency, expected', [
+        ('USD', '$'),
+        ('INR', '₹'),
+        ('XYZ', '$'),
+    ])
+    def test_currency_symbol(self, currency, expected):
+        """Test USD, INR and unknown (defaults to $) symbols."""
+        assert get_currency_symbol(currency) == expected